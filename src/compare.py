@@ -0,0 +1,239 @@
+"""
+Comparison module for VTU Result Automation
+Compares two result runs of the same roster (e.g. before and after revaluation)
+and reports changed marks, pass/fail flips and newly cleared backlogs
+"""
+
+import argparse
+import os
+from config import RESULT_PASS
+from excel_io import (
+    load_result_workbook,
+    read_result_rows,
+    create_comparison_workbook,
+    write_comparison_sheets,
+    save_workbook,
+    read_export_rows,
+    check_export_path,
+    EXPORT_WRITERS,
+    parse_mark
+)
+
+# Change labels written to the comparison sheet
+CHANGE_BACKLOG_CLEARED = "BACKLOG CLEARED"
+CHANGE_PASS_TO_FAIL = "PASS TO FAIL"
+CHANGE_RESULT = "RESULT CHANGED"
+CHANGE_MARKS = "MARKS CHANGED"
+CHANGE_ADDED = "ONLY IN NEW RUN"
+CHANGE_REMOVED = "ONLY IN OLD RUN"
+
+
+def _normalize(subject):
+    """Build the record stored for one subject of one student, keeping non-numeric marks as text"""
+    return {
+        "ia": parse_mark(subject["ia"], subject["ia"]),
+        "see": parse_mark(subject["see"], subject["see"]),
+        "total": parse_mark(subject["total"], subject["total"]),
+        "res": str(subject["res"]).strip().upper()
+    }
+
+
+def index_results(rows):
+    """
+    Build a hash index of a result run keyed on USN and subject
+    
+    Args:
+        rows: Iterable of (usn, name, subjects) tuples
+    
+    Returns:
+        Tuple of (index, names) where index maps (usn, subject) to a record
+        and names maps usn to the student name
+    """
+    index = {}
+    names = {}
+    for usn, name, subjects in rows:
+        usn = usn.strip().upper()
+        names[usn] = name
+        for subject in subjects:
+            index[(usn, subject["name"].strip())] = _normalize(subject)
+    return index, names
+
+
+def classify_change(old, new):
+    """
+    Classify the difference between two records of the same subject
+    
+    Args:
+        old: Record from the earlier run
+        new: Record from the later run
+    
+    Returns:
+        Change label, or None if the records are identical
+    """
+    if old["res"] != new["res"]:
+        if new["res"] == RESULT_PASS:
+            return CHANGE_BACKLOG_CLEARED
+        if old["res"] == RESULT_PASS:
+            return CHANGE_PASS_TO_FAIL
+        return CHANGE_RESULT
+    if (old["ia"], old["see"], old["total"]) != (new["ia"], new["see"], new["total"]):
+        return CHANGE_MARKS
+    return None
+
+
+def _total_diff(old, new):
+    """Return the change in total marks, or an empty string if not computable"""
+    if old and new and isinstance(old["total"], int) and isinstance(new["total"], int):
+        return new["total"] - old["total"]
+    return ""
+
+
+def compare_results(old_rows, new_rows, include_missing_students=False):
+    """
+    Hash-join two result runs on USN and subject and collect the differences
+    
+    The old run is indexed once and the new run is streamed against it, so
+    the comparison is linear in the number of (student, subject) entries.
+    A revaluation run usually re-fetches only the students who applied, so
+    old entries are only reported as missing for students present in the
+    new run unless include_missing_students is set.
+    
+    Args:
+        old_rows: Iterable of (usn, name, subjects) tuples from the earlier run
+        new_rows: Iterable of (usn, name, subjects) tuples from the later run
+        include_missing_students: Also report students absent from the new run
+    
+    Returns:
+        List of change dictionaries containing usn, name, subject, old, new,
+        total_diff and change
+    """
+    old_index, old_names = index_results(old_rows)
+    new_usns = set()
+    changes = []
+    
+    for usn, name, subjects in new_rows:
+        usn = usn.strip().upper()
+        new_usns.add(usn)
+        for subject in subjects:
+            key = (usn, subject["name"].strip())
+            new = _normalize(subject)
+            old = old_index.pop(key, None)
+            
+            if old is None:
+                label = CHANGE_ADDED
+            else:
+                label = classify_change(old, new)
+                if label is None:
+                    continue
+            
+            changes.append({
+                "usn": usn,
+                "name": name,
+                "subject": key[1],
+                "old": old,
+                "new": new,
+                "total_diff": _total_diff(old, new),
+                "change": label
+            })
+    
+    # Whatever is left in the index was not present in the new run
+    for (usn, subject_name), old in old_index.items():
+        if usn not in new_usns and not include_missing_students:
+            continue
+        changes.append({
+            "usn": usn,
+            "name": old_names.get(usn, ""),
+            "subject": subject_name,
+            "old": old,
+            "new": None,
+            "total_diff": "",
+            "change": CHANGE_REMOVED
+        })
+    
+    return changes
+
+
+def load_result_rows(file_path):
+    """
+    Load result rows from a saved output workbook or a columnar export
+    
+    Args:
+        file_path: Path to an output .xls file or a .csv, .parquet,
+            .arrow or .feather export
+    
+    Returns:
+        Iterable of (usn, name, subjects) tuples or None on error
+    """
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension in EXPORT_WRITERS:
+        if not os.path.isfile(file_path):
+            print(f"Failed to open result export file: {file_path}")
+            return None
+        try:
+            check_export_path(file_path)
+        except ImportError as e:
+            print(f"Failed to open result export file: {e}")
+            return None
+        return read_export_rows(file_path)
+    
+    workbook = load_result_workbook(file_path)
+    if workbook is None:
+        return None
+    return read_result_rows(workbook)
+
+
+def run_comparison(old_path, new_path, save_path, include_missing_students=False):
+    """
+    Compare two saved result runs and save the differences to a workbook
+    
+    Args:
+        old_path: Path to the earlier result file
+        new_path: Path to the later result file
+        save_path: Path where the comparison workbook should be saved
+        include_missing_students: Also report students absent from the new run
+    
+    Returns:
+        List of change dictionaries, or None if an input could not be loaded
+    """
+    old_rows = load_result_rows(old_path)
+    new_rows = load_result_rows(new_path)
+    if old_rows is None or new_rows is None:
+        return None
+    
+    changes = compare_results(old_rows, new_rows, include_missing_students)
+    
+    workbook, orange_style = create_comparison_workbook()
+    sheet_count = write_comparison_sheets(workbook, changes, orange_style)
+    save_workbook(workbook, save_path)
+    if sheet_count > 1:
+        print(f"Comparison split across {sheet_count} sheets (.xls row limit)")
+    
+    counts = {}
+    for change in changes:
+        counts[change["change"]] = counts.get(change["change"], 0) + 1
+    for label, count in sorted(counts.items()):
+        print(f"{label}: {count}")
+    
+    return changes
+
+
+def main():
+    """Command line entry point for comparing two result runs"""
+    parser = argparse.ArgumentParser(
+        description="Compare two VTU result runs (e.g. before and after revaluation)"
+    )
+    parser.add_argument("old", help="Earlier result file (.xls or a .csv/.parquet/.arrow export)")
+    parser.add_argument("new", help="Later result file (.xls or a .csv/.parquet/.arrow export)")
+    parser.add_argument("output", help="Path for the comparison workbook (.xls)")
+    parser.add_argument(
+        "--include-missing-students", action="store_true",
+        help="Also list students that are absent from the new run"
+    )
+    args = parser.parse_args()
+    
+    if run_comparison(args.old, args.new, args.output, args.include_missing_students) is None:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -18,6 +18,31 @@ EXCEL_SUBHEADER_ROW = 1
 EXCEL_USN_COLUMN = 0
 EXCEL_NAME_COLUMN = 2
 EXCEL_SUBJECTS_START_COLUMN = 4
+EXCEL_COLUMNS_PER_SUBJECT = 4
+
+# Maximum number of rows in one .xls sheet
+EXCEL_MAX_ROWS = 65536
+
+# Second output sheet recording each student's own subject codes, in the
+# same row and order as their marks on the first sheet
+SUBJECT_CODES_SHEET_NAME = "sheet2"
+SUBJECT_CODES_START_COLUMN = 1
+
+# Comparison sheet configuration (spills into "Comparison (2)", ... when full)
+COMPARISON_SHEET_NAME = "Comparison"
+COMPARISON_HEADERS = [
+    "USN", "NAME", "SUBJECT",
+    "OLD IA", "OLD SEE", "OLD TOTAL", "OLD RES",
+    "NEW IA", "NEW SEE", "NEW TOTAL", "NEW RES",
+    "TOTAL DIFF", "CHANGE"
+]
+
+# Columnar export configuration (one row per student per subject)
+EXPORT_COLUMNS = ["usn", "name", "subject", "ia", "see", "total", "result"]
+EXPORT_INTEGER_COLUMNS = ("ia", "see", "total")
+# Rows buffered per Parquet row group / Arrow record batch; large groups keep
+# per-group metadata low and let dictionary encoding and compression work
+EXPORT_BATCH_ROWS = 65536
 
 # Subject columns in result page
 SUBJECT_NAME_INDEX = 1
@@ -26,6 +51,9 @@ SUBJECT_SEE_INDEX = 4
 SUBJECT_TOTAL_INDEX = 5
 SUBJECT_RESULT_INDEX = 6
 
+# Result status written by the VTU portal for a passed subject
+RESULT_PASS = "P"
+
 # Maximum number of subjects to check
 MAX_SUBJECTS = 14
 
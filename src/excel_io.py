@@ -1,16 +1,29 @@
 """
 Excel I/O module for VTU Result Automation
-Handles reading USN values from input file and writing results to output file
+Handles reading USN values from input file and writing results to output file,
+plus long-format CSV / Parquet / Arrow export of the same results
 """
 
+import csv
+import os
 import openpyxl
+import xlrd
 import xlwt
 from config import (
     EXCEL_HEADER_ROW,
     EXCEL_SUBHEADER_ROW,
     EXCEL_USN_COLUMN,
     EXCEL_NAME_COLUMN,
-    EXCEL_SUBJECTS_START_COLUMN
+    EXCEL_SUBJECTS_START_COLUMN,
+    EXCEL_COLUMNS_PER_SUBJECT,
+    EXCEL_MAX_ROWS,
+    SUBJECT_CODES_SHEET_NAME,
+    SUBJECT_CODES_START_COLUMN,
+    COMPARISON_SHEET_NAME,
+    COMPARISON_HEADERS,
+    EXPORT_COLUMNS,
+    EXPORT_INTEGER_COLUMNS,
+    EXPORT_BATCH_ROWS
 )
 
 
@@ -53,16 +66,16 @@ def create_output_workbook():
     Create a new output workbook for storing results
     
     Returns:
-        Tuple of (workbook, sheet, orange_style)
+        Tuple of (workbook, sheet, codes_sheet, orange_style)
     """
     workbook = xlwt.Workbook()
     sheet = workbook.add_sheet("Sheet1", cell_overwrite_ok=True)
-    workbook.add_sheet("sheet2", cell_overwrite_ok=True)
+    codes_sheet = workbook.add_sheet(SUBJECT_CODES_SHEET_NAME, cell_overwrite_ok=True)
     
     # Orange style for result column highlighting
     orange_style = xlwt.easyxf("pattern: pattern solid, fore_colour orange")
     
-    return workbook, sheet, orange_style
+    return workbook, sheet, codes_sheet, orange_style
 
 
 def write_headers(sheet):
@@ -116,7 +129,209 @@ def write_subject_data(sheet, row_index, subjects, orange_style):
         sheet.write(row_index + 1, col + 2, int(sub["total"]))
         sheet.write(row_index + 1, col + 3, sub["res"], orange_style)
         
-        col += 4
+        col += EXCEL_COLUMNS_PER_SUBJECT
+
+
+def write_subject_codes(codes_sheet, row_index, usn, subjects):
+    """
+    Record the student's own subject codes in the order their marks were written
+    
+    The subject headers on the first sheet are shared by every student, so
+    this is what lets results be read back correctly for mixed rosters
+    (electives, lateral-entry or backlog-only students).
+    
+    Args:
+        codes_sheet: The subject codes worksheet
+        row_index: Row number the student's data was written to
+        usn: Student USN
+        subjects: List of subject dictionaries containing name, ia, see, total, res
+    """
+    codes_sheet.write(row_index + 1, EXCEL_USN_COLUMN, usn)
+    for i, sub in enumerate(subjects):
+        codes_sheet.write(row_index + 1, SUBJECT_CODES_START_COLUMN + i, sub["name"])
+
+
+def load_result_workbook(file_path):
+    """
+    Load a previously saved output workbook for reading
+    
+    Args:
+        file_path: Path to an output .xls file written by save_workbook
+        
+    Returns:
+        The workbook or None on error
+    """
+    try:
+        return xlrd.open_workbook(file_path)
+    except Exception as e:
+        print(f"Failed to open result Excel file: {e}")
+        return None
+
+
+def parse_mark(value, default=None):
+    """
+    Convert a mark to int
+    
+    Args:
+        value: Mark as read from the result page, a workbook or an export
+        default: Value returned for non-numeric marks
+        
+    Returns:
+        The mark as an int, or default if it is not numeric
+    """
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _cell_text(values, col):
+    """Return the stripped text of a cell, or an empty string past the row end"""
+    if col >= len(values):
+        return ""
+    value = values[col]
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).strip()
+
+
+def _subject_codes(codes_sheet, row):
+    """Return the subject codes recorded for one row of the codes sheet"""
+    if codes_sheet is None or row >= codes_sheet.nrows:
+        return []
+    values = codes_sheet.row_values(row)
+    return [
+        _cell_text(values, col)
+        for col in range(SUBJECT_CODES_START_COLUMN, len(values))
+        if _cell_text(values, col)
+    ]
+
+
+def read_result_rows(workbook):
+    """
+    Read student results back from an output workbook
+    
+    Subject codes are taken per student from the codes sheet written by
+    write_subject_codes. Workbooks saved before that sheet existed fall back
+    to the shared header row, which is only correct when every student has
+    the same subjects in the same order.
+    
+    Args:
+        workbook: Workbook laid out by write_headers/write_subject_data
+        
+    Yields:
+        Tuples of (usn, name, subjects) where subjects is a list of
+        dictionaries containing name, ia, see, total, res
+    """
+    sheet = workbook.sheet_by_index(0)
+    codes_sheet = None
+    if SUBJECT_CODES_SHEET_NAME in workbook.sheet_names():
+        codes_sheet = workbook.sheet_by_name(SUBJECT_CODES_SHEET_NAME)
+        if codes_sheet.nrows == 0:
+            codes_sheet = None
+    
+    header_codes = []
+    if codes_sheet is None:
+        print("No subject codes sheet found, using shared headers "
+              "(only valid if all students have the same subjects)")
+        header = sheet.row_values(EXCEL_HEADER_ROW)
+        header_codes = [
+            _cell_text(header, col)
+            for col in range(EXCEL_SUBJECTS_START_COLUMN, len(header), EXCEL_COLUMNS_PER_SUBJECT)
+        ]
+    
+    for row in range(EXCEL_SUBHEADER_ROW + 1, sheet.nrows):
+        values = sheet.row_values(row)
+        usn = _cell_text(values, EXCEL_USN_COLUMN)
+        if not usn:
+            continue
+        
+        codes = _subject_codes(codes_sheet, row) if codes_sheet else header_codes
+        
+        subjects = []
+        for i, subject_name in enumerate(codes):
+            col = EXCEL_SUBJECTS_START_COLUMN + i * EXCEL_COLUMNS_PER_SUBJECT
+            ia = _cell_text(values, col)
+            if not subject_name or not ia:
+                continue
+            subjects.append({
+                "name": subject_name,
+                "ia": ia,
+                "see": _cell_text(values, col + 1),
+                "total": _cell_text(values, col + 2),
+                "res": _cell_text(values, col + 3)
+            })
+        
+        yield usn, _cell_text(values, EXCEL_NAME_COLUMN), subjects
+
+
+def create_comparison_workbook():
+    """
+    Create a new workbook for storing the differences between two result runs
+    
+    Returns:
+        Tuple of (workbook, orange_style)
+    """
+    workbook = xlwt.Workbook()
+    
+    # Orange style for change column highlighting
+    orange_style = xlwt.easyxf("pattern: pattern solid, fore_colour orange")
+    
+    return workbook, orange_style
+
+
+def _add_comparison_sheet(workbook, number):
+    """Add a comparison sheet with headers, numbering it after the first one"""
+    name = COMPARISON_SHEET_NAME if number == 1 else f"{COMPARISON_SHEET_NAME} ({number})"
+    sheet = workbook.add_sheet(name, cell_overwrite_ok=True)
+    for col, title in enumerate(COMPARISON_HEADERS):
+        sheet.write(EXCEL_HEADER_ROW, col, title)
+    return sheet
+
+
+def write_comparison_sheets(workbook, changes, orange_style):
+    """
+    Write the differences between two result runs to comparison sheets
+    
+    An .xls sheet holds at most EXCEL_MAX_ROWS rows, so larger comparisons
+    spill into "Comparison (2)", "Comparison (3)" and so on.
+    
+    Args:
+        workbook: The comparison workbook
+        changes: List of change dictionaries produced by compare_results
+        orange_style: Excel style for highlighting the change column
+        
+    Returns:
+        Number of sheets written
+    """
+    sheet_count = 1
+    sheet = _add_comparison_sheet(workbook, sheet_count)
+    row = EXCEL_HEADER_ROW + 1
+    
+    for change in changes:
+        if row >= EXCEL_MAX_ROWS:
+            sheet_count += 1
+            sheet = _add_comparison_sheet(workbook, sheet_count)
+            row = EXCEL_HEADER_ROW + 1
+        
+        old = change["old"] or {}
+        new = change["new"] or {}
+        sheet.write(row, 0, change["usn"])
+        sheet.write(row, 1, change["name"])
+        sheet.write(row, 2, change["subject"])
+        sheet.write(row, 3, old.get("ia", ""))
+        sheet.write(row, 4, old.get("see", ""))
+        sheet.write(row, 5, old.get("total", ""))
+        sheet.write(row, 6, old.get("res", ""))
+        sheet.write(row, 7, new.get("ia", ""))
+        sheet.write(row, 8, new.get("see", ""))
+        sheet.write(row, 9, new.get("total", ""))
+        sheet.write(row, 10, new.get("res", ""))
+        sheet.write(row, 11, change["total_diff"])
+        sheet.write(row, 12, change["change"], orange_style)
+        row += 1
+    
+    return sheet_count
 
 
 def save_workbook(workbook, file_path):
@@ -129,3 +344,234 @@ def save_workbook(workbook, file_path):
     """
     workbook.save(file_path)
     print(f"Saved results to {file_path}")
+
+
+def _import_pyarrow():
+    """Import pyarrow lazily so it is only required for Parquet/Arrow export"""
+    try:
+        import pyarrow
+        return pyarrow
+    except ImportError:
+        raise ImportError("Parquet/Arrow export requires pyarrow (pip install pyarrow)")
+
+
+class CsvResultWriter:
+    """Streams results to a CSV file, one row per student per subject"""
+    
+    def __init__(self, file_path):
+        """
+        Open the CSV file and write the header row
+        
+        Args:
+            file_path: Path where the CSV file should be saved
+        """
+        self.file_path = file_path
+        self.file = open(file_path, "w", newline="", encoding="utf-8")
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(EXPORT_COLUMNS)
+    
+    def write_student(self, usn, name, subjects):
+        """
+        Write all subjects of one student
+        
+        Args:
+            usn: Student USN
+            name: Student name
+            subjects: List of subject dictionaries containing name, ia, see, total, res
+        """
+        for sub in subjects:
+            self.writer.writerow([
+                usn, name, sub["name"], sub["ia"], sub["see"], sub["total"], sub["res"]
+            ])
+    
+    def close(self):
+        """Flush and close the CSV file"""
+        self.file.close()
+        print(f"Exported results to {self.file_path}")
+
+
+class _BatchedArrowWriter:
+    """
+    Base class for pyarrow-backed writers
+    
+    Rows are buffered per column and flushed as record batches of
+    EXPORT_BATCH_ROWS rows, so memory use does not grow with the roster.
+    Subclasses set open_writer to the function that opens the file.
+    """
+    
+    open_writer = None
+    
+    def __init__(self, file_path):
+        """
+        Open the output file with the long-format schema
+        
+        Args:
+            file_path: Path where the file should be saved
+        """
+        self.pa = _import_pyarrow()
+        self.file_path = file_path
+        self.schema = self.pa.schema([
+            (column, self.pa.int16() if column in EXPORT_INTEGER_COLUMNS else self.pa.string())
+            for column in EXPORT_COLUMNS
+        ])
+        self.columns = {column: [] for column in EXPORT_COLUMNS}
+        self.pending = 0
+        self.writer = self.open_writer(file_path, self.schema)
+    
+    def write_student(self, usn, name, subjects):
+        """
+        Buffer all subjects of one student, flushing full batches
+        
+        Args:
+            usn: Student USN
+            name: Student name
+            subjects: List of subject dictionaries containing name, ia, see, total, res
+        """
+        for sub in subjects:
+            self.columns["usn"].append(usn)
+            self.columns["name"].append(name)
+            self.columns["subject"].append(sub["name"])
+            self.columns["ia"].append(parse_mark(sub["ia"]))
+            self.columns["see"].append(parse_mark(sub["see"]))
+            self.columns["total"].append(parse_mark(sub["total"]))
+            self.columns["result"].append(sub["res"])
+            self.pending += 1
+        
+        if self.pending >= EXPORT_BATCH_ROWS:
+            self._flush()
+    
+    def _flush(self):
+        """Write the buffered rows as one record batch"""
+        if not self.pending:
+            return
+        batch = self.pa.record_batch(
+            [self.pa.array(self.columns[column], type=self.schema.field(column).type)
+             for column in EXPORT_COLUMNS],
+            schema=self.schema
+        )
+        self.writer.write_batch(batch)
+        self.columns = {column: [] for column in EXPORT_COLUMNS}
+        self.pending = 0
+    
+    def close(self):
+        """Flush remaining rows and close the file"""
+        self._flush()
+        self.writer.close()
+        print(f"Exported results to {self.file_path}")
+
+
+def _open_parquet_writer(file_path, schema):
+    """Create a Parquet writer for the long-format schema"""
+    import pyarrow.parquet as pq
+    return pq.ParquetWriter(file_path, schema)
+
+
+def _open_arrow_writer(file_path, schema):
+    """Create an Arrow IPC file writer for the long-format schema"""
+    import pyarrow.ipc as ipc
+    return ipc.new_file(file_path, schema)
+
+
+class ParquetResultWriter(_BatchedArrowWriter):
+    """Streams results to a Parquet file"""
+    
+    open_writer = staticmethod(_open_parquet_writer)
+
+
+class ArrowResultWriter(_BatchedArrowWriter):
+    """Streams results to an Arrow IPC (Feather v2) file"""
+    
+    open_writer = staticmethod(_open_arrow_writer)
+
+
+# Writer class by file extension
+EXPORT_WRITERS = {
+    ".csv": CsvResultWriter,
+    ".parquet": ParquetResultWriter,
+    ".arrow": ArrowResultWriter,
+    ".feather": ArrowResultWriter
+}
+
+
+def check_export_path(file_path):
+    """
+    Check that an export path has a supported format and its dependencies
+    
+    Args:
+        file_path: Path to a .csv, .parquet, .arrow or .feather file
+    
+    Returns:
+        Writer class for the file extension
+    
+    Raises:
+        ValueError: If the extension is not supported
+        ImportError: If the format needs pyarrow and it is not installed
+    """
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension not in EXPORT_WRITERS:
+        raise ValueError(f"Unsupported export format: {extension or file_path}")
+    writer_class = EXPORT_WRITERS[extension]
+    if issubclass(writer_class, _BatchedArrowWriter):
+        _import_pyarrow()
+    return writer_class
+
+
+def create_export_writer(file_path):
+    """
+    Create a columnar export writer based on the file extension
+    
+    Args:
+        file_path: Path to a .csv, .parquet, .arrow or .feather file
+    
+    Returns:
+        Writer with write_student(usn, name, subjects) and close() methods
+    """
+    return check_export_path(file_path)(file_path)
+
+
+def _read_csv_export(file_path):
+    """Yield one result row dictionary per line of a CSV export"""
+    with open(file_path, newline="", encoding="utf-8") as f:
+        yield from csv.DictReader(f)
+
+
+def _read_arrow_export(file_path):
+    """Yield one result row dictionary per row of a Parquet or Arrow export"""
+    pa = _import_pyarrow()
+    if file_path.lower().endswith(".parquet"):
+        import pyarrow.parquet as pq
+        batches = pq.ParquetFile(file_path).iter_batches(batch_size=EXPORT_BATCH_ROWS)
+        for batch in batches:
+            yield from batch.to_pylist()
+    else:
+        import pyarrow.ipc as ipc
+        with pa.memory_map(file_path) as source:
+            reader = ipc.open_file(source)
+            for i in range(reader.num_record_batches):
+                yield from reader.get_batch(i).to_pylist()
+
+
+def read_export_rows(file_path):
+    """
+    Read results back from a CSV, Parquet or Arrow export
+    
+    Args:
+        file_path: Path to a file written by one of the export writers
+    
+    Yields:
+        Tuples of (usn, name, subjects) with one subject per row
+    """
+    writer_class = check_export_path(file_path)
+    if writer_class is CsvResultWriter:
+        rows = _read_csv_export(file_path)
+    else:
+        rows = _read_arrow_export(file_path)
+    
+    for row in rows:
+        yield row["usn"], row["name"], [{
+            "name": row["subject"],
+            "ia": row["ia"],
+            "see": row["see"],
+            "total": row["total"],
+            "res": row["result"]
+        }]
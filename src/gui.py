@@ -28,6 +28,7 @@ class AutomationGUI:
         self.usn_file = tk.StringVar()
         self.website = tk.StringVar()
         self.save_path = tk.StringVar()
+        self.export_path = tk.StringVar()
         self.start_row = tk.StringVar()
         self.end_row = tk.StringVar()
         
@@ -66,6 +67,15 @@ class AutomationGUI:
             [("Excel Files", "*.xls"), ("All Files", "*.*")]
         )
     
+    def _choose_export_path(self):
+        """Open file picker for optional columnar export file path"""
+        self._pick_file(
+            self.export_path,
+            [("CSV Files", "*.csv"), ("Parquet Files", "*.parquet"),
+             ("Arrow Files", "*.arrow"), ("Feather Files", "*.feather"),
+             ("All Files", "*.*")]
+        )
+    
     def _create_widgets(self):
         """Create and layout all GUI widgets"""
         
@@ -110,37 +120,48 @@ class AutomationGUI:
             row=4, column=2, padx=10
         )
         
+        # Export path input (optional CSV / Parquet / Arrow)
+        tk.Label(self.app, text="EXPORT PATH (optional):").grid(
+            row=5, column=0, sticky=tk.W, padx=10, pady=10
+        )
+        tk.Entry(self.app, textvariable=self.export_path, width=40).grid(
+            row=5, column=1, padx=10
+        )
+        tk.Button(self.app, text="CHOOSE", command=self._choose_export_path).grid(
+            row=5, column=2, padx=10
+        )
+        
         # Start row input
         tk.Label(self.app, text="USN START (Row):").grid(
-            row=5, column=0, sticky=tk.W, padx=10, pady=10
+            row=6, column=0, sticky=tk.W, padx=10, pady=10
         )
         tk.Entry(self.app, textvariable=self.start_row, width=20).grid(
-            row=5, column=1, padx=10, sticky=tk.W
+            row=6, column=1, padx=10, sticky=tk.W
         )
         
         # End row input
         tk.Label(self.app, text="USN END (Row):").grid(
-            row=6, column=0, sticky=tk.W, padx=10, pady=10
+            row=7, column=0, sticky=tk.W, padx=10, pady=10
         )
         tk.Entry(self.app, textvariable=self.end_row, width=20).grid(
-            row=6, column=1, padx=10, sticky=tk.W
+            row=7, column=1, padx=10, sticky=tk.W
         )
         
         # Submit and Quit buttons
         tk.Button(
             self.app, text="SUBMIT", command=self._handle_submit,
             width=15, bg="#dddddd"
-        ).grid(row=7, column=0, pady=20, padx=10)
+        ).grid(row=8, column=0, pady=20, padx=10)
         
         tk.Button(
             self.app, text="QUIT", command=self.app.quit,
             width=15, bg="#ffcccc"
-        ).grid(row=7, column=1, pady=20, padx=10)
+        ).grid(row=8, column=1, pady=20, padx=10)
         
         # Credit label
         tk.Label(
             self.app, text="Original by: Samarth Kashyap\nDepartment of CSE"
-        ).grid(row=8, column=2, pady=10)
+        ).grid(row=9, column=2, pady=10)
     
     def _handle_submit(self):
         """Handle submit button click - validate and trigger callback"""
@@ -158,6 +179,7 @@ class AutomationGUI:
             "usn_file": self.usn_file.get().strip(),
             "website": self.website.get().strip(),
             "save_path": self.save_path.get().strip(),
+            "export_path": self.export_path.get().strip(),
             "start_row": self.start_row.get(),
             "end_row": self.end_row.get()
         }
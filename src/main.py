@@ -12,7 +12,10 @@ from excel_io import (
     write_headers,
     write_student_info,
     write_subject_data,
-    save_workbook
+    write_subject_codes,
+    save_workbook,
+    check_export_path,
+    create_export_writer
 )
 
 
@@ -28,6 +31,7 @@ def process_results(gui, inputs):
     usn_file = inputs["usn_file"]
     website = inputs["website"]
     save_path = inputs["save_path"]
+    export_path = inputs["export_path"]
     
     # Validate row inputs
     try:
@@ -37,6 +41,14 @@ def process_results(gui, inputs):
         gui.show_error("Start/End row must be numbers.")
         return
     
+    # Validate optional export path before starting the browser
+    if export_path:
+        try:
+            check_export_path(export_path)
+        except (ValueError, ImportError) as e:
+            gui.show_error(f"Invalid export path: {e}")
+            return
+    
     # Load input Excel file containing USNs
     in_book, in_sheet = load_input_workbook(usn_file)
     if not in_book:
@@ -44,7 +56,7 @@ def process_results(gui, inputs):
         return
     
     # Create output Excel workbook for results
-    out_book, out_sheet, orange_style = create_output_workbook()
+    out_book, out_sheet, codes_sheet, orange_style = create_output_workbook()
     
     # Write static headers
     write_headers(out_sheet)
@@ -73,51 +85,72 @@ def process_results(gui, inputs):
         scraper.cleanup()
         return
     
-    # Process each USN from the input file
-    success_count = 0
-    error_count = 0
-    
-    for row in range(start_row, end_row + 1):
-        usn = read_usn(in_sheet, row)
-        
-        if not usn:
-            continue
-        
-        # Enter USN and captcha, submit the form
-        scraper.enter_usn_and_captcha(usn, captcha)
-        
-        # Open result page in new window
-        if not scraper.submit_and_switch_to_result():
-            error_count += 1
-            continue
-        
+    # Open optional columnar export (CSV / Parquet / Arrow)
+    export_writer = None
+    if export_path:
         try:
-            # Extract student information
-            page_usn, name = scraper.scrape_student_info()
-            if not page_usn or not name:
-                error_count += 1
-                scraper.close_result_and_return_to_main()
+            export_writer = create_export_writer(export_path)
+        except (ValueError, ImportError, OSError) as e:
+            gui.show_error(f"Failed to open export file: {e}")
+            scraper.cleanup()
+            return
+    
+    # Close the export even if the loop or the save fails, so a
+    # Parquet/Arrow file keeps its footer and the batches written so far
+    try:
+        # Process each USN from the input file
+        success_count = 0
+        error_count = 0
+        
+        for row in range(start_row, end_row + 1):
+            usn = read_usn(in_sheet, row)
+            
+            if not usn:
                 continue
             
-            # Extract all subject details
-            subjects = scraper.scrape_subjects()
+            # Enter USN and captcha, submit the form
+            scraper.enter_usn_and_captcha(usn, captcha)
             
-            # Write student info to Excel
-            write_student_info(out_sheet, row, page_usn, name)
+            # Open result page in new window
+            if not scraper.submit_and_switch_to_result():
+                error_count += 1
+                continue
             
-            # Write subject data to Excel
-            write_subject_data(out_sheet, row, subjects, orange_style)
-            success_count += 1
+            try:
+                # Extract student information
+                page_usn, name = scraper.scrape_student_info()
+                if not page_usn or not name:
+                    error_count += 1
+                    scraper.close_result_and_return_to_main()
+                    continue
+                
+                # Extract all subject details
+                subjects = scraper.scrape_subjects()
+                
+                # Write student info to Excel
+                write_student_info(out_sheet, row, page_usn, name)
+                
+                # Write subject data to Excel
+                write_subject_data(out_sheet, row, subjects, orange_style)
+                write_subject_codes(codes_sheet, row, page_usn, subjects)
+                
+                # Stream the same data to the columnar export
+                if export_writer:
+                    export_writer.write_student(page_usn, name, subjects)
+                success_count += 1
+                
+            except Exception as e:
+                print(f"Error processing {usn}: {e}")
+                error_count += 1
             
-        except Exception as e:
-            print(f"Error processing {usn}: {e}")
-            error_count += 1
+            # Close result window and return to main page
+            scraper.close_result_and_return_to_main()
         
-        # Close result window and return to main page
-        scraper.close_result_and_return_to_main()
-    
-    # Save the output Excel file
-    save_workbook(out_book, save_path)
+        # Save the output Excel file
+        save_workbook(out_book, save_path)
+    finally:
+        if export_writer:
+            export_writer.close()
     
     gui.show_info(f"Processing complete.\nProcessed: {success_count}\nErrors: {error_count}")
     scraper.cleanup()